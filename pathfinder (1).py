@@ -10,7 +10,8 @@ Complete pathfinding visualizer with:
 6. Bidirectional Search
 
 Installation:
-    pip install pygame
+    pip install pygame numpy
+    pip install numba  # Optional, compiles the fast-mode search kernels
 
 Controls:
     Algorithm Selection: Click algorithm buttons
@@ -20,24 +21,35 @@ Controls:
     SPACE: Run selected algorithm
     C: Clear search
     R: Reset grid
+    F: Toggle fast mode (search runs to completion, then is replayed)
 """
 
 import pygame
 import sys
-from collections import deque
 import heapq
-from enum import Enum
-import random
+from enum import IntEnum
+import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional - kernels then run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 
-class CellType(Enum):
+
+# Neighbor offsets (row, col) in clockwise order
+_MOVES = ((-1, 0), (0, 1), (1, 0), (1, 1), (0, -1), (-1, -1))
+_MOVES_REV = _MOVES[::-1]
+
+
+class CellType(IntEnum):
     EMPTY = 0
     WALL = 1
     START = 2
     TARGET = 3
 
 
-class CellState(Enum):
+class CellState(IntEnum):
     NONE = 0
     FRONTIER = 1
     EXPLORED = 2
@@ -46,27 +58,473 @@ class CellState(Enum):
     EXPLORED2 = 5  # For bidirectional search (second explored)
 
 
+class Algo(IntEnum):
+    """Search algorithms, in button / number-key order"""
+    BFS = 0
+    DFS = 1
+    UCS = 2
+    DLS = 3
+    IDDFS = 4
+    BIDIRECTIONAL = 5
+
+
+# Plain int values of the enums for hot loops (no enum attribute lookups)
+EMPTY_V = CellType.EMPTY.value
+WALL_V = CellType.WALL.value
+START_V = CellType.START.value
+TARGET_V = CellType.TARGET.value
+
+NONE_V = CellState.NONE.value
+FRONTIER_V = CellState.FRONTIER.value
+EXPLORED_V = CellState.EXPLORED.value
+PATH_V = CellState.PATH.value
+FRONTIER2_V = CellState.FRONTIER2.value
+EXPLORED2_V = CellState.EXPLORED2.value
+
+
 class Colors:
-    """Color palette"""
-    EMPTY = (255, 255, 255)
-    WALL = (44, 62, 80)
-    START = (39, 174, 96)
-    TARGET = (231, 76, 60)
-    FRONTIER = (243, 156, 18)
-    EXPLORED = (52, 152, 219)
-    PATH = (155, 89, 182)
-    FRONTIER2 = (230, 126, 34)      # Orange for second frontier
-    EXPLORED2 = (26, 188, 156)      # Teal for second explored
-    GRID_LINE = (189, 195, 199)
-    BG = (236, 240, 241)
-    UI_BG = (52, 73, 94)
-    UI_TEXT = (236, 240, 241)
-    BUTTON = (46, 204, 113)
-    BUTTON_HOVER = (39, 174, 96)
-    BUTTON_SELECTED = (241, 196, 15)
-    WARNING = (230, 126, 34)
-    SUCCESS = (46, 204, 113)
-    ERROR = (231, 76, 60)
+    """Color palette (pygame.Color instances, so draw calls skip tuple conversion)"""
+    EMPTY = pygame.Color(255, 255, 255)
+    WALL = pygame.Color(44, 62, 80)
+    START = pygame.Color(39, 174, 96)
+    TARGET = pygame.Color(231, 76, 60)
+    FRONTIER = pygame.Color(243, 156, 18)
+    EXPLORED = pygame.Color(52, 152, 219)
+    PATH = pygame.Color(155, 89, 182)
+    FRONTIER2 = pygame.Color(230, 126, 34)      # Orange for second frontier
+    EXPLORED2 = pygame.Color(26, 188, 156)      # Teal for second explored
+    GRID_LINE = pygame.Color(189, 195, 199)
+    BG = pygame.Color(236, 240, 241)
+    UI_BG = pygame.Color(52, 73, 94)
+    UI_TEXT = pygame.Color(236, 240, 241)
+    BUTTON = pygame.Color(46, 204, 113)
+    BUTTON_HOVER = pygame.Color(39, 174, 96)
+    BUTTON_SELECTED = pygame.Color(241, 196, 15)
+    WARNING = pygame.Color(230, 126, 34)
+    SUCCESS = pygame.Color(46, 204, 113)
+    ERROR = pygame.Color(231, 76, 60)
+
+
+class NodeQueue:
+    """FIFO queue of node indices backed by a preallocated int32 array"""
+    
+    def __init__(self, capacity):
+        # BFS queues each node at most once, so the buffer never wraps
+        self.items = np.empty(capacity, dtype=np.int32)
+        self.head = 0
+        self.tail = 0
+    
+    def __len__(self):
+        return self.tail - self.head
+    
+    def append(self, node):
+        self.items[self.tail] = node
+        self.tail += 1
+    
+    def popleft(self):
+        node = self.items[self.head]
+        self.head += 1
+        return int(node)
+    
+    def clear(self):
+        self.head = 0
+        self.tail = 0
+
+
+# UCS move costs in integer thousandths (diagonal ~ sqrt(2))
+STRAIGHT_COST = 1000
+DIAGONAL_COST = 1414
+
+# IDDFS gives up once its depth limit passes this
+IDDFS_MAX_DEPTH = 50
+
+# depth_of value for nodes never pushed by DLS/IDDFS
+_NO_DEPTH = np.iinfo(np.int32).max
+
+# Kernel copy of the neighbor offsets
+_MOVES_ARR = np.array(_MOVES, dtype=np.int64)
+
+
+@njit(cache=True)
+def bit_test(bits, i):
+    """Read bit i of a bitmap packed into uint64 words"""
+    return (bits[i >> 6] >> np.uint64(i & 63)) & np.uint64(1)
+
+
+@njit(cache=True)
+def bit_set(bits, i):
+    """Set bit i of a bitmap packed into uint64 words"""
+    bits[i >> 6] |= np.uint64(1) << np.uint64(i & 63)
+
+
+# Kernel traces, replayed one expansion at a time by replay_step:
+#   steps[k] = (expanded node or -1 for an IDDFS restart, frontier size afterwards,
+#               end of this expansion's rows in marks)
+#   marks[i] = (node, CellState value) for every cell-state write, in order
+
+
+@njit(cache=True)
+def new_trace(max_steps):
+    """Allocate step and mark buffers for a kernel expanding at most max_steps nodes"""
+    steps = np.empty((max_steps, 3), np.int32)
+    marks = np.empty((max_steps * (_MOVES_ARR.shape[0] + 1), 2), np.int32)
+    return steps, marks
+
+
+@njit(cache=True)
+def add_step(steps, n_steps, node, frontier_size, n_marks):
+    """Append an expansion to a trace and return the new step count"""
+    steps[n_steps, 0] = node
+    steps[n_steps, 1] = frontier_size
+    steps[n_steps, 2] = n_marks
+    return n_steps + 1
+
+
+@njit(cache=True)
+def add_mark(marks, n_marks, node, state):
+    """Append a cell-state write to a trace and return the new mark count"""
+    marks[n_marks, 0] = node
+    marks[n_marks, 1] = state
+    return n_marks + 1
+
+
+@njit(cache=True)
+def neighbor_of(grid, node, k):
+    """Node reached from node by move k, or -1 if that is off the grid or a wall"""
+    rows, cols = grid.shape
+    nr = node // cols + _MOVES_ARR[k, 0]
+    nc = node % cols + _MOVES_ARR[k, 1]
+    if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != WALL_V:
+        return nr * cols + nc
+    return -1
+
+
+@njit(cache=True)
+def bfs_full(grid, start, target, depth_limit):
+    """
+    Run BFS to completion on the grid.
+    
+    All *_full kernels share this signature (depth_limit is only read by DLS)
+    and return (found, meeting, came_from, came_from_backward, steps, marks):
+    whether target was reached, the node where the path was closed, parent
+    indices for each search direction, and the trace for step replay.
+    """
+    rows, cols = grid.shape
+    num_nodes = rows * cols
+    came_from = np.full(num_nodes, -1, np.int32)
+    steps, marks = new_trace(num_nodes)
+    queue = np.empty(num_nodes, np.int32)  # Never wraps: each node is queued once
+    visited = np.zeros((num_nodes + 63) // 64, np.uint64)  # Discovered nodes, 1 bit each
+    
+    queue[0] = start
+    head, tail = 0, 1
+    came_from[start] = start
+    bit_set(visited, start)
+    n_steps = n_marks = 0
+    
+    while head < tail:
+        current = queue[head]
+        head += 1
+        n_marks = add_mark(marks, n_marks, current, EXPLORED_V)
+        
+        if current == target:
+            n_steps = add_step(steps, n_steps, current, tail - head, n_marks)
+            return True, target, came_from, came_from[:0], steps[:n_steps], marks[:n_marks]
+        
+        for k in range(_MOVES_ARR.shape[0]):
+            neighbor = neighbor_of(grid, current, k)
+            if neighbor >= 0 and bit_test(visited, neighbor) == 0:
+                bit_set(visited, neighbor)
+                came_from[neighbor] = current
+                queue[tail] = neighbor
+                tail += 1
+                n_marks = add_mark(marks, n_marks, neighbor, FRONTIER_V)
+        
+        n_steps = add_step(steps, n_steps, current, tail - head, n_marks)
+    
+    return False, -1, came_from, came_from[:0], steps[:n_steps], marks[:n_marks]
+
+
+@njit(cache=True)
+def dfs_full(grid, start, target, depth_limit):
+    """Run DFS to completion on the grid (see bfs_full for the return value)"""
+    rows, cols = grid.shape
+    num_nodes = rows * cols
+    came_from = np.full(num_nodes, -1, np.int32)
+    steps, marks = new_trace(num_nodes)
+    stack = np.empty(num_nodes, np.int32)  # A node is never on the stack twice
+    on_stack = np.zeros(num_nodes, np.bool_)
+    explored = np.zeros(num_nodes, np.bool_)
+    
+    stack[0] = start
+    top = 1
+    on_stack[start] = True
+    came_from[start] = start
+    n_steps = n_marks = 0
+    
+    while top > 0:
+        top -= 1
+        current = stack[top]
+        on_stack[current] = False
+        if explored[current]:
+            continue
+        
+        explored[current] = True
+        n_marks = add_mark(marks, n_marks, current, EXPLORED_V)
+        
+        if current == target:
+            n_steps = add_step(steps, n_steps, current, top, n_marks)
+            return True, target, came_from, came_from[:0], steps[:n_steps], marks[:n_marks]
+        
+        for k in range(_MOVES_ARR.shape[0] - 1, -1, -1):  # Reverse to maintain clockwise
+            neighbor = neighbor_of(grid, current, k)
+            if neighbor >= 0 and not explored[neighbor] and not on_stack[neighbor]:
+                stack[top] = neighbor
+                top += 1
+                on_stack[neighbor] = True
+                came_from[neighbor] = current
+                n_marks = add_mark(marks, n_marks, neighbor, FRONTIER_V)
+        
+        n_steps = add_step(steps, n_steps, current, top, n_marks)
+    
+    return False, -1, came_from, came_from[:0], steps[:n_steps], marks[:n_marks]
+
+
+@njit(cache=True)
+def ucs_full(grid, start, target, depth_limit):
+    """Run UCS to completion on the grid (see bfs_full for the return value)"""
+    rows, cols = grid.shape
+    num_nodes = rows * cols
+    came_from = np.full(num_nodes, -1, np.int32)
+    steps, marks = new_trace(num_nodes)
+    cost_so_far = np.full(num_nodes, np.iinfo(np.int64).max, np.int64)
+    is_open = np.zeros(num_nodes, np.bool_)  # Nodes still open in the heap
+    explored = np.zeros(num_nodes, np.bool_)
+    
+    heap = [(0, 0, start)]  # (cost, push order, node)
+    is_open[start] = True
+    came_from[start] = start
+    cost_so_far[start] = 0
+    push_count = 0
+    n_steps = n_marks = 0
+    
+    while len(heap) > 0:
+        cost, _, current = heapq.heappop(heap)
+        if not is_open[current]:  # Stale entry, already expanded
+            continue
+        is_open[current] = False
+        
+        explored[current] = True
+        n_marks = add_mark(marks, n_marks, current, EXPLORED_V)
+        
+        if current == target:
+            n_steps = add_step(steps, n_steps, current, len(heap), n_marks)
+            return True, target, came_from, came_from[:0], steps[:n_steps], marks[:n_marks]
+        
+        for k in range(_MOVES_ARR.shape[0]):
+            neighbor = neighbor_of(grid, current, k)
+            if neighbor >= 0 and not explored[neighbor]:
+                if abs(neighbor - current) == cols + 1:  # Diagonal
+                    new_cost = cost_so_far[current] + DIAGONAL_COST
+                else:
+                    new_cost = cost_so_far[current] + STRAIGHT_COST
+                
+                if new_cost < cost_so_far[neighbor]:
+                    cost_so_far[neighbor] = new_cost
+                    push_count += 1
+                    heapq.heappush(heap, (new_cost, push_count, neighbor))
+                    is_open[neighbor] = True
+                    came_from[neighbor] = current
+                    n_marks = add_mark(marks, n_marks, neighbor, FRONTIER_V)
+        
+        n_steps = add_step(steps, n_steps, current, len(heap), n_marks)
+    
+    return False, -1, came_from, came_from[:0], steps[:n_steps], marks[:n_marks]
+
+
+@njit(cache=True)
+def depth_limited_pass(grid, start, target, limit, came_from, steps, n_steps, marks, n_marks):
+    """
+    Run one depth-limited DFS from start, appending to the trace.
+    
+    Returns (found, n_steps, n_marks); came_from is reset and filled in place.
+    """
+    num_nodes = came_from.shape[0]
+    explored = np.zeros(num_nodes, np.bool_)
+    depth_of = np.full(num_nodes, _NO_DEPTH, np.int32)
+    # Each expansion pushes a neighbor at most once
+    stack_nodes = np.empty(_MOVES_ARR.shape[0] * num_nodes + 1, np.int32)
+    stack_depths = np.empty(_MOVES_ARR.shape[0] * num_nodes + 1, np.int32)
+    
+    came_from[:] = -1
+    came_from[start] = start
+    depth_of[start] = 0
+    stack_nodes[0] = start
+    stack_depths[0] = 0
+    top = 1
+    
+    while top > 0:
+        top -= 1
+        current = stack_nodes[top]
+        depth = stack_depths[top]
+        if explored[current]:
+            continue
+        
+        explored[current] = True
+        n_marks = add_mark(marks, n_marks, current, EXPLORED_V)
+        
+        if current == target:
+            n_steps = add_step(steps, n_steps, current, top, n_marks)
+            return True, n_steps, n_marks
+        
+        if depth < limit:
+            for k in range(_MOVES_ARR.shape[0] - 1, -1, -1):
+                neighbor = neighbor_of(grid, current, k)
+                # Skip neighbors already waiting on the stack at the same or a shallower depth
+                if neighbor >= 0 and not explored[neighbor] and depth + 1 < depth_of[neighbor]:
+                    depth_of[neighbor] = depth + 1
+                    stack_nodes[top] = neighbor
+                    stack_depths[top] = depth + 1
+                    top += 1
+                    if came_from[neighbor] == -1:
+                        came_from[neighbor] = current
+                    n_marks = add_mark(marks, n_marks, neighbor, FRONTIER_V)
+        
+        n_steps = add_step(steps, n_steps, current, top, n_marks)
+    
+    return False, n_steps, n_marks
+
+
+@njit(cache=True)
+def dls_full(grid, start, target, depth_limit):
+    """Run DLS to completion on the grid (see bfs_full for the return value)"""
+    rows, cols = grid.shape
+    came_from = np.empty(rows * cols, np.int32)
+    steps, marks = new_trace(rows * cols)
+    found, n_steps, n_marks = depth_limited_pass(grid, start, target, depth_limit, came_from,
+                                                 steps, 0, marks, 0)
+    meeting = target if found else -1
+    return found, meeting, came_from, came_from[:0], steps[:n_steps], marks[:n_marks]
+
+
+@njit(cache=True)
+def iddfs_full(grid, start, target, depth_limit):
+    """Run IDDFS to completion on the grid (see bfs_full for the return value)"""
+    rows, cols = grid.shape
+    num_nodes = rows * cols
+    came_from = np.empty(num_nodes, np.int32)
+    steps, marks = new_trace((IDDFS_MAX_DEPTH + 1) * (num_nodes + 1))
+    n_steps = n_marks = 0
+    limit = 0
+    
+    while True:
+        found, n_steps, n_marks = depth_limited_pass(grid, start, target, limit, came_from,
+                                                     steps, n_steps, marks, n_marks)
+        if found:
+            return True, target, came_from, came_from[:0], steps[:n_steps], marks[:n_marks]
+        
+        # Stack ran dry: record a restart at the next depth (empty frontier once past the max)
+        limit += 1
+        n_steps = add_step(steps, n_steps, -1, 1 if limit <= IDDFS_MAX_DEPTH else 0, n_marks)
+        if limit > IDDFS_MAX_DEPTH:
+            return False, -1, came_from, came_from[:0], steps[:n_steps], marks[:n_marks]
+
+
+@njit(cache=True)
+def bidirectional_full(grid, start, target, depth_limit):
+    """Run bidirectional BFS to completion on the grid (see bfs_full for the return value)"""
+    rows, cols = grid.shape
+    num_nodes = rows * cols
+    came_from_forward = np.full(num_nodes, -1, np.int32)
+    came_from_backward = np.full(num_nodes, -1, np.int32)
+    steps, marks = new_trace(num_nodes)
+    queue_forward = np.empty(num_nodes, np.int32)  # Never wrap: each node is queued once per side
+    queue_backward = np.empty(num_nodes, np.int32)
+    open_forward = np.zeros(num_nodes, np.bool_)
+    open_backward = np.zeros(num_nodes, np.bool_)
+    explored_forward = np.zeros(num_nodes, np.bool_)
+    explored_backward = np.zeros(num_nodes, np.bool_)
+    
+    queue_forward[0] = start
+    queue_backward[0] = target
+    head_forward, tail_forward = 0, 1
+    head_backward, tail_backward = 0, 1
+    open_forward[start] = True
+    open_backward[target] = True
+    came_from_forward[start] = start
+    came_from_backward[target] = target
+    n_steps = n_marks = 0
+    
+    while head_forward < tail_forward or head_backward < tail_backward:
+        # Expand the smaller frontier (grid nodes all have similar degree)
+        forward_size = tail_forward - head_forward
+        backward_size = tail_backward - head_backward
+        if forward_size and (forward_size <= backward_size or not backward_size):
+            current = queue_forward[head_forward]
+            head_forward += 1
+            open_forward[current] = False
+            explored_forward[current] = True
+            n_marks = add_mark(marks, n_marks, current, EXPLORED_V)
+            meeting = current if current == target else -1  # Only when start == target
+            
+            if meeting < 0:
+                for k in range(_MOVES_ARR.shape[0]):
+                    neighbor = neighbor_of(grid, current, k)
+                    if neighbor >= 0 and not explored_forward[neighbor] and not open_forward[neighbor]:
+                        queue_forward[tail_forward] = neighbor
+                        tail_forward += 1
+                        open_forward[neighbor] = True
+                        came_from_forward[neighbor] = current
+                        
+                        # Meet as soon as the backward search has reached this node
+                        if explored_backward[neighbor] or open_backward[neighbor]:
+                            meeting = neighbor
+                            break
+                        
+                        n_marks = add_mark(marks, n_marks, neighbor, FRONTIER_V)
+        
+        else:
+            current = queue_backward[head_backward]
+            head_backward += 1
+            open_backward[current] = False
+            explored_backward[current] = True
+            n_marks = add_mark(marks, n_marks, current, EXPLORED2_V)
+            meeting = current if current == start else -1
+            
+            if meeting < 0:
+                for k in range(_MOVES_ARR.shape[0]):
+                    neighbor = neighbor_of(grid, current, k)
+                    if neighbor >= 0 and not explored_backward[neighbor] and not open_backward[neighbor]:
+                        queue_backward[tail_backward] = neighbor
+                        tail_backward += 1
+                        open_backward[neighbor] = True
+                        came_from_backward[neighbor] = current
+                        
+                        # Meet as soon as the forward search has reached this node
+                        if explored_forward[neighbor] or open_forward[neighbor]:
+                            meeting = neighbor
+                            break
+                        
+                        n_marks = add_mark(marks, n_marks, neighbor, FRONTIER2_V)
+        
+        frontier_size = (tail_forward - head_forward) + (tail_backward - head_backward)
+        n_steps = add_step(steps, n_steps, current, frontier_size, n_marks)
+        if meeting >= 0:
+            return (True, meeting, came_from_forward, came_from_backward,
+                    steps[:n_steps], marks[:n_marks])
+    
+    return False, -1, came_from_forward, came_from_backward, steps[:n_steps], marks[:n_marks]
+
+
+# Algorithms that can run to completion in a compiled kernel (fast mode)
+FAST_KERNELS = {
+    Algo.BFS: bfs_full,
+    Algo.DFS: dfs_full,
+    Algo.UCS: ucs_full,
+    Algo.DLS: dls_full,
+    Algo.IDDFS: iddfs_full,
+    Algo.BIDIRECTIONAL: bidirectional_full,
+}
 
 
 class AllAlgorithmsPathfinder:
@@ -93,10 +551,63 @@ class AllAlgorithmsPathfinder:
         self.button_font = pygame.font.Font(None, 18)
         self.info_font = pygame.font.Font(None, 16)
         self.stats_font = pygame.font.Font(None, 15)
+        self.label_font = pygame.font.Font(None, int(cell_size * 1.3))
+        
+        # Start/target cell labels
+        self.start_label = self.label_font.render('S', True, (255, 255, 255))
+        self.target_label = self.label_font.render('T', True, (255, 255, 255))
+        
+        # Fixed UI text, rendered once
+        instructions = "S=Start | T=Target | SPACE=Run | C=Clear | R=Reset | F=Fast | Drag=Walls | ESC=Exit"
+        self.label_surfaces = {
+            'algorithms': self.info_font.render("Select Algorithm (or press 1-6):", True, Colors.UI_TEXT),
+            'controls': self.info_font.render("Controls:", True, Colors.UI_TEXT),
+            'presets': self.info_font.render("Presets:", True, Colors.UI_TEXT),
+            'speed': self.info_font.render("Speed:", True, Colors.UI_TEXT),
+            'instructions': self.stats_font.render(instructions, True, Colors.UI_TEXT),
+        }
+        algo_info = {
+            'BFS': "BFS: Queue (FIFO) - Guarantees shortest path",
+            'DFS': "DFS: Stack (LIFO) - Goes deep first",
+            'UCS': "UCS: Priority Queue - Considers edge costs",
+            'DLS': "DLS: Depth-Limited DFS - Stops at depth limit",
+            'IDDFS': "IDDFS: Iterative Deepening - Increases depth gradually",
+            'Bidirectional': "Bidirectional: Searches from both ends"
+        }
+        self.algo_info_surfaces = {
+            algo: self.stats_font.render(text, True, Colors.UI_TEXT) for algo, text in algo_info.items()
+        }
         
-        # Grid
-        self.grid = [[CellType.EMPTY for _ in range(cols)] for _ in range(rows)]
-        self.cell_states = [[CellState.NONE for _ in range(cols)] for _ in range(rows)]
+        # Pre-rendered cell tiles (with grid line), one per distinct color, and a lookup
+        # table from a packed (CellType << 3 | CellState) byte to the tile's index
+        tile_of_color = {}
+        self.cell_tiles = []
+        self.tile_lut = np.zeros(len(CellType) << 3, dtype=np.uint8)
+        for cell_type in CellType:
+            for cell_state in CellState:
+                color = self.get_cell_color(cell_type, cell_state)
+                key = tuple(color)  # pygame.Color is unhashable
+                if key not in tile_of_color:
+                    tile = pygame.Surface((cell_size, cell_size)).convert()
+                    tile.fill(color)
+                    pygame.draw.rect(tile, Colors.GRID_LINE, tile.get_rect(), 1)
+                    tile_of_color[key] = len(self.cell_tiles)
+                    self.cell_tiles.append(tile)
+                self.tile_lut[cell_type << 3 | cell_state] = tile_of_color[key]
+        
+        # Grid (one byte per cell holding CellType / CellState values)
+        self.grid = np.zeros((rows, cols), dtype=np.uint8)
+        self.cell_states = np.zeros((rows, cols), dtype=np.uint8)  # Also the explored/frontier membership the step functions test
+        self.cell_states_flat = self.cell_states.reshape(-1)  # View indexed by node
+        
+        # Tile index each cell currently shows; draw() repaints only cells that differ (255 = never drawn)
+        self.drawn_tiles = np.full((rows, cols), 255, dtype=np.uint8)
+        
+        # Screen rect of every cell, indexed by node
+        self.cell_rects = [
+            pygame.Rect(col * cell_size, row * cell_size + self.ui_height, cell_size, cell_size)
+            for row in range(rows) for col in range(cols)
+        ]
         
         # State
         self.start = None
@@ -105,35 +616,56 @@ class AllAlgorithmsPathfinder:
         self.dragging = False
         self.drag_erase = False
         
-        # Algorithm selection
+        # Algorithm selection (selected_algorithm is the display name of algo)
+        self.algo = Algo.BFS
         self.selected_algorithm = 'BFS'
-        self.algorithms = ['BFS', 'DFS', 'UCS', 'DLS', 'IDDFS', 'Bidirectional']
-        
-        # Search state
-        self.frontier = None
-        self.explored = set()
-        self.came_from = {}
+        self.algorithms = ['BFS', 'DFS', 'UCS', 'DLS', 'IDDFS', 'Bidirectional']  # Indexed by Algo
+        self.step_functions = {
+            Algo.BFS: self.bfs_step,
+            Algo.DFS: self.dfs_step,
+            Algo.UCS: self.ucs_step,
+            Algo.DLS: self.dls_step,
+            Algo.IDDFS: self.iddfs_step,
+            Algo.BIDIRECTIONAL: self.bidirectional_step,
+        }
+        self.algo_step = None  # Runs one interpreted search step; set by start_search
+        self.step_fn = None  # Runs up to n search steps per frame; set by start_search
+        
+        # Search state (nodes are flat indices: row * cols + col)
+        num_nodes = rows * cols
+        self.start_idx = None
+        self.target_idx = None
+        self.frontier = []  # Container type depends on the algorithm; never None
+        self.forward_queue = NodeQueue(num_nodes)  # Reused by BFS and bidirectional
+        self.backward_queue = NodeQueue(num_nodes)
+        self.came_from = np.full(num_nodes, -1, dtype=np.int32)  # Parent index, -1 = unvisited
         self.final_path = []
         self.search_complete = False
         self.searching = False
         self.step_count = 0
+        self.explored_count = 0  # Nodes marked explored (both directions for bidirectional)
+        self.frontier_count = 0  # Entries in the frontier(s), stale heap entries included
+        
+        # Fast mode: whole search runs in a kernel, then gets replayed
+        self.fast_mode = False
+        self.replay = None  # (steps, marks, found, meeting) from the kernel
+        self.replay_cursor = 0
         
         # Algorithm-specific state
         self.depth_limit = 20  # For DLS
         self.current_depth_limit = 0  # For IDDFS
+        self.depth_of = np.full(num_nodes, _NO_DEPTH, dtype=np.int32)  # Shallowest pushed depth (DLS/IDDFS)
         self.cost_so_far = {}  # For UCS
+        self.push_count = 0  # UCS heap tie-breaker (FIFO among equal costs)
         
         # Bidirectional specific
-        self.frontier_forward = None
-        self.frontier_backward = None
-        self.explored_forward = set()
-        self.explored_backward = set()
-        self.came_from_forward = {}
-        self.came_from_backward = {}
+        self.came_from_forward = np.full(num_nodes, -1, dtype=np.int32)
+        self.came_from_backward = np.full(num_nodes, -1, dtype=np.int32)
         self.meeting_point = None
         
         # Animation
         self.animation_delay = 20
+        self.steps_per_frame = 1  # Algorithm steps run between redraws
         self.last_step_time = 0
         self.clock = pygame.time.Clock()
         self.fps = 60
@@ -179,16 +711,33 @@ class AllAlgorithmsPathfinder:
             self.create_button(start_x + (bw + spacing) * 3, y3, bw, bh, "Random", lambda: self.load_preset('random')),
         ]
         
-        # Speed and depth controls
+        # Speed, depth, steps and fast mode controls
         speed_x = self.window_width - 160
         self.misc_buttons = [
             self.create_button(speed_x, y1, 35, bh, "➖", self.decrease_speed),
             self.create_button(speed_x + 40, y1, 35, bh, "➕", self.increase_speed),
             self.create_button(speed_x, y2, 35, bh, "D-", self.decrease_depth),
             self.create_button(speed_x + 40, y2, 35, bh, "D+", self.increase_depth),
+            self.create_button(speed_x, y3, 35, bh, "▼", self.decrease_steps),
+            self.create_button(speed_x + 40, y3, 35, bh, "▲", self.increase_steps),
+            self.create_button(speed_x + 80, y3, bw, bh, "Fast: Off", self.toggle_fast_mode),
         ]
+        self.fast_button = self.misc_buttons[-1]
         
         self.all_buttons = self.algo_buttons + self.control_buttons + self.preset_buttons + self.misc_buttons
+        self.button_rects = [btn['rect'] for btn in self.all_buttons]
+        
+        # UI panel background, fixed labels and buttons; re-rendered only when a button
+        # changes (ui_stale) or the mouse moves onto a different button
+        self.ui_surface = pygame.Surface((self.window_width, self.ui_height)).convert()
+        self.ui_stale = True
+        self.hovered_button = None  # Index into all_buttons
+        self.mouse_pos = pygame.mouse.get_pos()  # Kept current from mouse events after this
+        
+        # Per-frame UI text: slot -> (text, color, surface), re-rendered only when it changes
+        self.text_surfaces = {}
+        self.stats_key = None  # Counters the cached stats line was built from
+        self.needs_redraw = True  # run() skips draw() on frames where nothing happened
     
     def create_button(self, x, y, w, h, text, callback, color=Colors.BUTTON):
         return {
@@ -203,6 +752,7 @@ class AllAlgorithmsPathfinder:
     def select_algorithm(self, algo):
         """Select which algorithm to use"""
         if not self.searching:
+            self.algo = Algo(self.algorithms.index(algo))
             self.selected_algorithm = algo
             # Update button colors
             for btn in self.algo_buttons:
@@ -210,6 +760,7 @@ class AllAlgorithmsPathfinder:
                     btn['color'] = Colors.BUTTON_SELECTED
                 else:
                     btn['color'] = btn['base_color']
+            self.ui_stale = True
             self.update_status(f"{algo} selected! Press ▶ Run or SPACE to start", Colors.SUCCESS)
     
     def set_start_mode(self):
@@ -222,6 +773,18 @@ class AllAlgorithmsPathfinder:
             self.mode = 'target'
             self.update_status("Click anywhere to place TARGET point", Colors.ERROR)
     
+    def toggle_fast_mode(self):
+        """Toggle running the search in a compiled kernel and replaying it"""
+        if not self.searching:
+            self.fast_mode = not self.fast_mode
+            self.fast_button['text'] = "Fast: On" if self.fast_mode else "Fast: Off"
+            self.fast_button['color'] = Colors.BUTTON_SELECTED if self.fast_mode else self.fast_button['base_color']
+            self.ui_stale = True
+            if self.fast_mode:
+                self.update_status("Fast mode ON", Colors.SUCCESS)
+            else:
+                self.update_status("Fast mode OFF", Colors.UI_TEXT)
+    
     def increase_speed(self):
         self.animation_delay = max(1, self.animation_delay - 10)
         self.update_status(f"Speed: {self.animation_delay}ms delay", Colors.UI_TEXT)
@@ -238,6 +801,14 @@ class AllAlgorithmsPathfinder:
         self.depth_limit = max(5, self.depth_limit - 5)
         self.update_status(f"DLS Depth Limit: {self.depth_limit}", Colors.UI_TEXT)
     
+    def increase_steps(self):
+        self.steps_per_frame = min(500, self.steps_per_frame * 2)
+        self.update_status(f"Steps per frame: {self.steps_per_frame}", Colors.UI_TEXT)
+    
+    def decrease_steps(self):
+        self.steps_per_frame = max(1, self.steps_per_frame // 2)
+        self.update_status(f"Steps per frame: {self.steps_per_frame}", Colors.UI_TEXT)
+    
     def update_status(self, message, color=None):
         self.status_message = message
         if color:
@@ -245,8 +816,8 @@ class AllAlgorithmsPathfinder:
     
     def reset_grid(self):
         if not self.searching:
-            self.grid = [[CellType.EMPTY for _ in range(self.cols)] for _ in range(self.rows)]
-            self.cell_states = [[CellState.NONE for _ in range(self.cols)] for _ in range(self.rows)]
+            self.grid.fill(CellType.EMPTY)
+            self.cell_states.fill(CellState.NONE)
             self.start = None
             self.target = None
             self.clear_search()
@@ -256,27 +827,30 @@ class AllAlgorithmsPathfinder:
     def clear_search_visual(self):
         if not self.searching:
             self.clear_search()
-            self.cell_states = [[CellState.NONE for _ in range(self.cols)] for _ in range(self.rows)]
+            self.cell_states.fill(CellState.NONE)
             self.update_status("Search cleared!", Colors.WARNING)
     
     def clear_search(self):
-        self.frontier = None
-        self.explored = set()
-        self.came_from = {}
+        self.frontier = []
+        self.forward_queue.clear()
+        self.backward_queue.clear()
+        self.came_from.fill(-1)
         self.final_path = []
         self.search_complete = False
         self.searching = False
         self.step_count = 0
+        self.explored_count = 0
+        self.frontier_count = 0
+        self.replay = None
+        self.replay_cursor = 0
         self.cost_so_far = {}
+        self.push_count = 0
         self.current_depth_limit = 0
+        self.depth_of.fill(_NO_DEPTH)
         
         # Bidirectional
-        self.frontier_forward = None
-        self.frontier_backward = None
-        self.explored_forward = set()
-        self.explored_backward = set()
-        self.came_from_forward = {}
-        self.came_from_backward = {}
+        self.came_from_forward.fill(-1)
+        self.came_from_backward.fill(-1)
         self.meeting_point = None
     
     def load_preset(self, preset_name):
@@ -295,13 +869,13 @@ class AllAlgorithmsPathfinder:
             self.target = (self.rows - 3, self.cols - 3)
             for i in range(5, self.rows - 5, 8):
                 for j in range(5, self.cols - 5):
-                    self.grid[i][j] = CellType.WALL
+                    self.grid[i, j] = CellType.WALL
                 for j in range(10, self.cols - 5):
                     if i + 4 < self.rows:
-                        self.grid[i + 4][j] = CellType.WALL
-                self.grid[i][self.cols - 10] = CellType.EMPTY
+                        self.grid[i + 4, j] = CellType.WALL
+                self.grid[i, self.cols - 10] = CellType.EMPTY
                 if i + 4 < self.rows:
-                    self.grid[i + 4][10] = CellType.EMPTY
+                    self.grid[i + 4, 10] = CellType.EMPTY
         
         elif preset_name == 'spiral':
             self.start = (self.rows // 2, self.cols // 2)
@@ -310,32 +884,31 @@ class AllAlgorithmsPathfinder:
                 offset = layer * 3
                 for j in range(offset, self.cols - offset):
                     if offset < self.rows:
-                        self.grid[offset][j] = CellType.WALL
+                        self.grid[offset, j] = CellType.WALL
                 for i in range(offset, self.rows - offset):
                     if self.cols - offset - 1 >= 0:
-                        self.grid[i][self.cols - offset - 1] = CellType.WALL
+                        self.grid[i, self.cols - offset - 1] = CellType.WALL
                 for j in range(offset, self.cols - offset):
                     if self.rows - offset - 1 >= 0:
-                        self.grid[self.rows - offset - 1][j] = CellType.WALL
+                        self.grid[self.rows - offset - 1, j] = CellType.WALL
                 for i in range(offset + 1, self.rows - offset):
                     if offset >= 0:
-                        self.grid[i][offset] = CellType.WALL
+                        self.grid[i, offset] = CellType.WALL
                 if offset + 3 < self.cols:
-                    self.grid[offset][offset + 3] = CellType.EMPTY
+                    self.grid[offset, offset + 3] = CellType.EMPTY
         
         elif preset_name == 'random':
             self.start = (5, 5)
             self.target = (self.rows - 6, self.cols - 6)
-            for i in range(self.rows):
-                for j in range(self.cols):
-                    if (i, j) != self.start and (i, j) != self.target:
-                        if random.random() < 0.25:
-                            self.grid[i][j] = CellType.WALL
+            mask = np.random.random((self.rows, self.cols)) < 0.25
+            mask[self.start] = False
+            mask[self.target] = False
+            self.grid[mask] = CellType.WALL
         
         if self.start:
-            self.grid[self.start[0]][self.start[1]] = CellType.START
+            self.grid[self.start] = CellType.START
         if self.target:
-            self.grid[self.target[0]][self.target[1]] = CellType.TARGET
+            self.grid[self.target] = CellType.TARGET
         
         self.update_status(f"{preset_name.capitalize()} maze loaded!", Colors.SUCCESS)
     
@@ -352,13 +925,16 @@ class AllAlgorithmsPathfinder:
     
     def handle_events(self):
         for event in pygame.event.get():
+            self.needs_redraw = True  # Any input (including mouse motion for hover) may change the screen
+            if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                self.mouse_pos = event.pos
+            
             if event.type == pygame.QUIT:
                 return False
             
-            for button in self.all_buttons:
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if button['rect'].collidepoint(event.pos) and button['enabled']:
-                        button['callback']()
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window contents were lost: repaint every grid cell next frame
+                self.drawn_tiles.fill(255)
             
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -373,6 +949,8 @@ class AllAlgorithmsPathfinder:
                     self.clear_search_visual()
                 elif event.key == pygame.K_r:
                     self.reset_grid()
+                elif event.key == pygame.K_f:
+                    self.toggle_fast_mode()
                 elif event.key == pygame.K_1:
                     self.select_algorithm('BFS')
                 elif event.key == pygame.K_2:
@@ -386,7 +964,19 @@ class AllAlgorithmsPathfinder:
                 elif event.key == pygame.K_6:
                     self.select_algorithm('Bidirectional')
             
-            if event.type == pygame.MOUSEBUTTONDOWN and not self.searching:
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:
+                    # One hit test against all button rects; a button click never reaches the grid
+                    hits = pygame.Rect(event.pos, (1, 1)).collidelistall(self.button_rects)
+                    if hits:
+                        for i in hits:
+                            button = self.all_buttons[i]
+                            if button['enabled']:
+                                button['callback']()
+                        continue
+                
+                if self.searching:
+                    continue
                 grid_pos = self.get_grid_pos(event.pos)
                 if grid_pos:
                     row, col = grid_pos
@@ -394,8 +984,8 @@ class AllAlgorithmsPathfinder:
                         self.dragging = True
                         self.handle_grid_click(row, col)
                     elif event.button == 3:
-                        if self.grid[row][col] == CellType.WALL:
-                            self.grid[row][col] = CellType.EMPTY
+                        if self.grid[row, col] == WALL_V:
+                            self.grid[row, col] = EMPTY_V
             
             elif event.type == pygame.MOUSEBUTTONUP:
                 self.dragging = False
@@ -406,37 +996,37 @@ class AllAlgorithmsPathfinder:
                     row, col = grid_pos
                     if (row, col) != self.start and (row, col) != self.target:
                         if self.drag_erase:
-                            self.grid[row][col] = CellType.EMPTY
+                            self.grid[row, col] = EMPTY_V
                         else:
-                            self.grid[row][col] = CellType.WALL
+                            self.grid[row, col] = WALL_V
         
         return True
     
     def handle_grid_click(self, row, col):
         if self.mode == 'wall':
             if (row, col) != self.start and (row, col) != self.target:
-                if self.grid[row][col] == CellType.WALL:
-                    self.grid[row][col] = CellType.EMPTY
+                if self.grid[row, col] == WALL_V:
+                    self.grid[row, col] = EMPTY_V
                     self.drag_erase = True
                 else:
-                    self.grid[row][col] = CellType.WALL
+                    self.grid[row, col] = WALL_V
                     self.drag_erase = False
         
         elif self.mode == 'start':
             if self.start:
                 old_row, old_col = self.start
-                self.grid[old_row][old_col] = CellType.EMPTY
+                self.grid[old_row, old_col] = EMPTY_V
             self.start = (row, col)
-            self.grid[row][col] = CellType.START
+            self.grid[row, col] = START_V
             self.mode = 'wall'
             self.update_status("Start set! Now set Target (T)", Colors.SUCCESS)
         
         elif self.mode == 'target':
             if self.target:
                 old_row, old_col = self.target
-                self.grid[old_row][old_col] = CellType.EMPTY
+                self.grid[old_row, old_col] = EMPTY_V
             self.target = (row, col)
-            self.grid[row][col] = CellType.TARGET
+            self.grid[row, col] = TARGET_V
             self.mode = 'wall'
             self.update_status("Target set! Press ▶ Run", Colors.SUCCESS)
     
@@ -449,86 +1039,196 @@ class AllAlgorithmsPathfinder:
             return
         
         self.clear_search()
-        self.cell_states = [[CellState.NONE for _ in range(self.cols)] for _ in range(self.rows)]
+        self.cell_states.fill(CellState.NONE)
         self.searching = True
         
-        algo = self.selected_algorithm
+        algo = self.algo
+        start = self.start_idx = self.encode(*self.start)
+        target = self.target_idx = self.encode(*self.target)
         
-        if algo == 'BFS':
-            self.frontier = deque([self.start])
-            self.came_from = {self.start: None}
-            self.cell_states[self.start[0]][self.start[1]] = CellState.FRONTIER
+        if algo is Algo.BFS:
+            self.frontier = self.forward_queue  # Emptied by clear_search
+            self.frontier.append(start)
+            self.came_from[start] = start
+            self.cell_states_flat[start] = FRONTIER_V
         
-        elif algo == 'DFS':
-            self.frontier = [self.start]  # Stack
-            self.came_from = {self.start: None}
-            self.cell_states[self.start[0]][self.start[1]] = CellState.FRONTIER
+        elif algo is Algo.DFS:
+            self.frontier = [start]  # Stack
+            self.came_from[start] = start
+            self.cell_states_flat[start] = FRONTIER_V
         
-        elif algo == 'UCS':
-            self.frontier = [(0, self.start)]  # Priority queue: (cost, node)
+        elif algo is Algo.UCS:
+            self.frontier = [(0, 0, start)]  # Priority queue: (cost, push order, node)
             heapq.heapify(self.frontier)
-            self.came_from = {self.start: None}
-            self.cost_so_far = {self.start: 0}
-            self.cell_states[self.start[0]][self.start[1]] = CellState.FRONTIER
+            self.came_from[start] = start
+            self.cost_so_far = {start: 0}
+            self.cell_states_flat[start] = FRONTIER_V
         
-        elif algo == 'DLS':
-            self.frontier = [(self.start, 0)]  # Stack with depth: (node, depth)
-            self.came_from = {self.start: None}
-            self.cell_states[self.start[0]][self.start[1]] = CellState.FRONTIER
+        elif algo is Algo.DLS:
+            self.frontier = [(start, 0)]  # Stack with depth: (node, depth)
+            self.came_from[start] = start
+            self.depth_of[start] = 0
+            self.cell_states_flat[start] = FRONTIER_V
         
-        elif algo == 'IDDFS':
+        elif algo is Algo.IDDFS:
             self.current_depth_limit = 0
-            self.frontier = [(self.start, 0)]
-            self.came_from = {self.start: None}
-            self.cell_states[self.start[0]][self.start[1]] = CellState.FRONTIER
+            self.frontier = [(start, 0)]
+            self.came_from[start] = start
+            self.depth_of[start] = 0
+            self.cell_states_flat[start] = FRONTIER_V
+        
+        elif algo is Algo.BIDIRECTIONAL:
+            self.forward_queue.append(start)
+            self.backward_queue.append(target)
+            self.came_from_forward[start] = start
+            self.came_from_backward[target] = target
+            self.cell_states_flat[start] = FRONTIER_V
+            self.cell_states_flat[target] = FRONTIER2_V
+        
+        self.frontier_count = 2 if algo is Algo.BIDIRECTIONAL else 1
+        
+        if self.fast_mode:
+            self.start_replay(FAST_KERNELS[algo])
+            self.step_fn = self.replay_steps
+            self.update_status(f"⚡ {self.selected_algorithm} replaying...", Colors.WARNING)
+            return
         
-        elif algo == 'Bidirectional':
-            self.frontier_forward = deque([self.start])
-            self.frontier_backward = deque([self.target])
-            self.came_from_forward = {self.start: None}
-            self.came_from_backward = {self.target: None}
-            self.cell_states[self.start[0]][self.start[1]] = CellState.FRONTIER
-            self.cell_states[self.target[0]][self.target[1]] = CellState.FRONTIER2
+        self.algo_step = self.step_functions[algo]
+        self.step_fn = self.run_steps
+        self.update_status(f"🔍 {self.selected_algorithm} searching...", Colors.WARNING)
+    
+    def run_steps(self, count):
+        """Run up to count interpreted search steps, stopping when the search ends"""
+        step = self.algo_step
+        for _ in range(count):
+            if not self.searching:
+                break
+            step()
+    
+    def start_replay(self, kernel):
+        """Run the search to completion in a kernel and queue it for replay"""
+        found, meeting, came_from, came_from_backward, steps, marks = kernel(
+            self.grid, self.start_idx, self.target_idx, self.depth_limit)
+        if self.algo is Algo.BIDIRECTIONAL:
+            self.came_from_forward[:] = came_from
+            self.came_from_backward[:] = came_from_backward
+        else:
+            self.came_from[:] = came_from
+        
+        # The kernel did the search: drop the frontiers start_search seeded
+        self.frontier = []
+        self.forward_queue.clear()
+        self.backward_queue.clear()
+        self.replay = (steps, marks, found, meeting)
+        self.replay_cursor = 0
+    
+    def replay_step(self):
+        """Replay one expansion recorded by a fast-mode kernel"""
+        steps, marks, found, meeting = self.replay
+        k = self.replay_cursor
+        if k >= len(steps):
+            self.finish_search(False)
+            return
+        
+        current, frontier_size, marks_end = steps[k].tolist()
+        marks_start = steps[k - 1, 2] if k else 0
+        self.replay_cursor = k + 1
+        self.frontier_count = frontier_size
         
-        self.update_status(f"🔍 {algo} searching...", Colors.WARNING)
+        if current < 0:
+            # IDDFS ran dry at this depth: deepen and restart, as iddfs_step does
+            self.current_depth_limit += 1
+            if self.current_depth_limit > IDDFS_MAX_DEPTH:
+                self.finish_search(False)
+                return
+            self.explored_count = 0
+            self.cell_states.fill(NONE_V)
+            self.cell_states_flat[self.start_idx] = FRONTIER_V
+            return
+        
+        self.explored_count += 1
+        
+        step_marks = marks[marks_start:marks_end]
+        self.cell_states_flat[step_marks[:, 0]] = step_marks[:, 1]
+        
+        if found and k == len(steps) - 1:
+            if self.algo is Algo.BIDIRECTIONAL:
+                self.meeting_point = meeting
+                self.reconstruct_bidirectional_path()
+            else:
+                self.reconstruct_path()
+            self.finish_search(True)
+            return
+        
+        self.step_count += 1
     
-    def get_neighbors(self, node):
-        """Get neighbors in clockwise order"""
-        row, col = node
+    def replay_steps(self, count):
+        """Replay up to count expansions, applying plain runs as array slices"""
+        steps, marks, found, _ = self.replay
+        # The goal expansion is left to replay_step so it can rebuild the path
+        last = len(steps) - 1 if found else len(steps)
+        while count > 0 and self.searching:
+            k = self.replay_cursor
+            end = min(k + count, last)
+            restarts = np.flatnonzero(steps[k:end, 0] < 0)
+            if restarts.size:
+                end = k + int(restarts[0])
+            if end <= k:
+                # A restart, the goal or the end of the trace
+                self.replay_step()
+                count -= 1
+                continue
+            
+            run = steps[k:end]
+            run_marks = marks[steps[k - 1, 2] if k else 0:run[-1, 2]]
+            # A node is often marked twice in a run (frontier, then explored): keep only its
+            # last mark, since NumPy does not define which write wins for repeated indices
+            run_marks = run_marks[::-1]
+            _, latest = np.unique(run_marks[:, 0], return_index=True)
+            self.cell_states_flat[run_marks[latest, 0]] = run_marks[latest, 1]
+            
+            n = end - k
+            self.explored_count += n
+            self.step_count += n
+            self.frontier_count = int(run[-1, 1])
+            self.replay_cursor = end
+            count -= n
+    
+    def encode(self, row, col):
+        """Flatten (row, col) into a node index"""
+        return row * self.cols + col
+    
+    def decode(self, node):
+        """Expand a node index back into (row, col)"""
+        return divmod(int(node), self.cols)
+    
+    def _neighbors(self, node, moves):
+        """Walkable neighbors of node, in the order of the given offset table"""
+        rows, cols, grid = self.rows, self.cols, self.grid
+        row, col = divmod(node, cols)
         neighbors = []
-        movements = [(-1, 0), (0, 1), (1, 0), (1, 1), (0, -1), (-1, -1)]
+        append = neighbors.append
         
-        for dr, dc in movements:
-            new_row, new_col = row + dr, col + dc
-            if 0 <= new_row < self.rows and 0 <= new_col < self.cols:
-                if self.grid[new_row][new_col] != CellType.WALL:
-                    neighbors.append((new_row, new_col))
+        for dr, dc in moves:
+            nr = row + dr
+            nc = col + dc
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != WALL_V:
+                append(nr * cols + nc)
         return neighbors
     
+    def get_neighbors(self, node):
+        """Get neighbors in clockwise order"""
+        return self._neighbors(node, _MOVES)
+    
+    def get_neighbors_reversed(self, node):
+        """Get neighbors in counter-clockwise order (stack push order for DFS variants)"""
+        return self._neighbors(node, _MOVES_REV)
+    
     def get_move_cost(self, from_node, to_node):
-        """Calculate cost of move (diagonal = 1.414, straight = 1.0)"""
-        r1, c1 = from_node
-        r2, c2 = to_node
-        if abs(r1 - r2) + abs(c1 - c2) == 2:  # Diagonal
-            return 1.414
-        return 1.0
-    
-    def algorithm_step(self):
-        """Execute one step of the selected algorithm"""
-        algo = self.selected_algorithm
-        
-        if algo == 'BFS':
-            return self.bfs_step()
-        elif algo == 'DFS':
-            return self.dfs_step()
-        elif algo == 'UCS':
-            return self.ucs_step()
-        elif algo == 'DLS':
-            return self.dls_step()
-        elif algo == 'IDDFS':
-            return self.iddfs_step()
-        elif algo == 'Bidirectional':
-            return self.bidirectional_step()
+        """Calculate cost of move in thousandths (diagonal = 1414, straight = 1000)"""
+        if abs(to_node - from_node) == self.cols + 1:  # Diagonal
+            return DIAGONAL_COST
+        return STRAIGHT_COST
     
     def bfs_step(self):
         """BFS step"""
@@ -537,21 +1237,21 @@ class AllAlgorithmsPathfinder:
             return
         
         current = self.frontier.popleft()
-        self.explored.add(current)
-        if current != self.start and current != self.target:
-            self.cell_states[current[0]][current[1]] = CellState.EXPLORED
+        self.frontier_count -= 1
+        self.cell_states_flat[current] = EXPLORED_V
+        self.explored_count += 1
         
-        if current == self.target:
+        if current == self.target_idx:
             self.reconstruct_path()
             self.finish_search(True)
             return
         
         for neighbor in self.get_neighbors(current):
-            if neighbor not in self.explored and neighbor not in self.frontier:
+            if self.cell_states_flat[neighbor] == NONE_V:  # Neither explored nor queued
                 self.frontier.append(neighbor)
+                self.frontier_count += 1
                 self.came_from[neighbor] = current
-                if neighbor != self.target:
-                    self.cell_states[neighbor[0]][neighbor[1]] = CellState.FRONTIER
+                self.cell_states_flat[neighbor] = FRONTIER_V
         
         self.step_count += 1
     
@@ -562,27 +1262,26 @@ class AllAlgorithmsPathfinder:
             return
         
         current = self.frontier.pop()  # LIFO - Stack
+        self.frontier_count -= 1
         
-        if current in self.explored:
+        if self.cell_states_flat[current] == EXPLORED_V:
             return
         
-        self.explored.add(current)
-        if current != self.start and current != self.target:
-            self.cell_states[current[0]][current[1]] = CellState.EXPLORED
+        self.cell_states_flat[current] = EXPLORED_V
+        self.explored_count += 1
         
-        if current == self.target:
+        if current == self.target_idx:
             self.reconstruct_path()
             self.finish_search(True)
             return
         
-        for neighbor in reversed(self.get_neighbors(current)):  # Reverse to maintain clockwise
-            if neighbor not in self.explored:
-                if neighbor not in [n for n in self.frontier]:
-                    self.frontier.append(neighbor)
-                    if neighbor not in self.came_from:
-                        self.came_from[neighbor] = current
-                    if neighbor != self.target:
-                        self.cell_states[neighbor[0]][neighbor[1]] = CellState.FRONTIER
+        for neighbor in self.get_neighbors_reversed(current):  # Reverse to maintain clockwise
+            # A node neither explored nor on the stack has never been pushed, so has no parent yet
+            if self.cell_states_flat[neighbor] == NONE_V:
+                self.frontier.append(neighbor)
+                self.frontier_count += 1
+                self.came_from[neighbor] = current
+                self.cell_states_flat[neighbor] = FRONTIER_V
         
         self.step_count += 1
     
@@ -592,30 +1291,32 @@ class AllAlgorithmsPathfinder:
             self.finish_search(False)
             return
         
-        cost, current = heapq.heappop(self.frontier)
+        cost, _, current = heapq.heappop(self.frontier)
+        self.frontier_count -= 1
         
-        if current in self.explored:
+        if self.cell_states_flat[current] == EXPLORED_V:  # Stale entry, already expanded
             return
         
-        self.explored.add(current)
-        if current != self.start and current != self.target:
-            self.cell_states[current[0]][current[1]] = CellState.EXPLORED
+        self.cell_states_flat[current] = EXPLORED_V
+        self.explored_count += 1
         
-        if current == self.target:
+        if current == self.target_idx:
             self.reconstruct_path()
             self.finish_search(True)
             return
         
         for neighbor in self.get_neighbors(current):
-            if neighbor not in self.explored:
+            if self.cell_states_flat[neighbor] != EXPLORED_V:
                 new_cost = self.cost_so_far[current] + self.get_move_cost(current, neighbor)
                 
                 if neighbor not in self.cost_so_far or new_cost < self.cost_so_far[neighbor]:
                     self.cost_so_far[neighbor] = new_cost
-                    heapq.heappush(self.frontier, (new_cost, neighbor))
+                    self.push_count += 1
+                    heapq.heappush(self.frontier, (new_cost, self.push_count, neighbor))
+                    self.frontier_count += 1
                     self.came_from[neighbor] = current
-                    if neighbor != self.target:
-                        self.cell_states[neighbor[0]][neighbor[1]] = CellState.FRONTIER
+                    if self.cell_states_flat[neighbor] != FRONTIER_V:  # Skip the write when re-pushing a frontier node
+                        self.cell_states_flat[neighbor] = FRONTIER_V
         
         self.step_count += 1
     
@@ -626,27 +1327,30 @@ class AllAlgorithmsPathfinder:
             return
         
         current, depth = self.frontier.pop()
+        self.frontier_count -= 1
         
-        if current in self.explored:
+        if self.cell_states_flat[current] == EXPLORED_V:
             return
         
-        self.explored.add(current)
-        if current != self.start and current != self.target:
-            self.cell_states[current[0]][current[1]] = CellState.EXPLORED
+        self.cell_states_flat[current] = EXPLORED_V
+        self.explored_count += 1
         
-        if current == self.target:
+        if current == self.target_idx:
             self.reconstruct_path()
             self.finish_search(True)
             return
         
         if depth < self.depth_limit:
-            for neighbor in reversed(self.get_neighbors(current)):
-                if neighbor not in self.explored:
+            for neighbor in self.get_neighbors_reversed(current):
+                # Skip neighbors already waiting on the stack at the same or a shallower depth
+                if self.cell_states_flat[neighbor] != EXPLORED_V and depth + 1 < self.depth_of[neighbor]:
+                    self.depth_of[neighbor] = depth + 1
                     self.frontier.append((neighbor, depth + 1))
-                    if neighbor not in self.came_from:
+                    self.frontier_count += 1
+                    if self.came_from[neighbor] == -1:
                         self.came_from[neighbor] = current
-                    if neighbor != self.target:
-                        self.cell_states[neighbor[0]][neighbor[1]] = CellState.FRONTIER
+                    if self.cell_states_flat[neighbor] != FRONTIER_V:  # Skip the write when re-pushing a frontier node
+                        self.cell_states_flat[neighbor] = FRONTIER_V
         
         self.step_count += 1
     
@@ -655,136 +1359,158 @@ class AllAlgorithmsPathfinder:
         if not self.frontier:
             # Increase depth limit and restart
             self.current_depth_limit += 1
-            if self.current_depth_limit > 50:  # Max depth limit
+            if self.current_depth_limit > IDDFS_MAX_DEPTH:
                 self.finish_search(False)
                 return
             
-            # Restart search with new depth limit
-            self.explored = set()
-            self.frontier = [(self.start, 0)]
-            self.came_from = {self.start: None}
-            self.cell_states = [[CellState.NONE for _ in range(self.cols)] for _ in range(self.rows)]
-            self.cell_states[self.start[0]][self.start[1]] = CellState.FRONTIER
+            # Restart search with new depth limit, reusing all buffers in place
+            self.explored_count = 0
+            self.frontier.append((self.start_idx, 0))  # Stack is empty here
+            self.frontier_count += 1
+            self.came_from.fill(-1)
+            self.came_from[self.start_idx] = self.start_idx
+            self.depth_of.fill(_NO_DEPTH)
+            self.depth_of[self.start_idx] = 0
+            self.cell_states.fill(NONE_V)
+            self.cell_states_flat[self.start_idx] = FRONTIER_V
             return
         
         current, depth = self.frontier.pop()
+        self.frontier_count -= 1
         
-        if current in self.explored:
+        if self.cell_states_flat[current] == EXPLORED_V:
             return
         
-        self.explored.add(current)
-        if current != self.start and current != self.target:
-            self.cell_states[current[0]][current[1]] = CellState.EXPLORED
+        self.cell_states_flat[current] = EXPLORED_V
+        self.explored_count += 1
         
-        if current == self.target:
+        if current == self.target_idx:
             self.reconstruct_path()
             self.finish_search(True)
             return
         
         if depth < self.current_depth_limit:
-            for neighbor in reversed(self.get_neighbors(current)):
-                if neighbor not in self.explored:
+            for neighbor in self.get_neighbors_reversed(current):
+                # Skip neighbors already waiting on the stack at the same or a shallower depth
+                if self.cell_states_flat[neighbor] != EXPLORED_V and depth + 1 < self.depth_of[neighbor]:
+                    self.depth_of[neighbor] = depth + 1
                     self.frontier.append((neighbor, depth + 1))
-                    if neighbor not in self.came_from:
+                    self.frontier_count += 1
+                    if self.came_from[neighbor] == -1:
                         self.came_from[neighbor] = current
-                    if neighbor != self.target:
-                        self.cell_states[neighbor[0]][neighbor[1]] = CellState.FRONTIER
+                    if self.cell_states_flat[neighbor] != FRONTIER_V:  # Skip the write when re-pushing a frontier node
+                        self.cell_states_flat[neighbor] = FRONTIER_V
         
         self.step_count += 1
     
     def bidirectional_step(self):
         """Bidirectional search step"""
-        if not self.frontier_forward and not self.frontier_backward:
+        if not self.forward_queue and not self.backward_queue:
             self.finish_search(False)
             return
         
-        # Alternate between forward and backward
-        if self.step_count % 2 == 0 and self.frontier_forward:
+        # Expand the smaller frontier (grid nodes all have similar degree)
+        forward_size = len(self.forward_queue)
+        backward_size = len(self.backward_queue)
+        if forward_size and (forward_size <= backward_size or not backward_size):
             # Forward search
-            current = self.frontier_forward.popleft()
-            self.explored_forward.add(current)
-            if current != self.start:
-                self.cell_states[current[0]][current[1]] = CellState.EXPLORED
+            current = self.forward_queue.popleft()
+            self.frontier_count -= 1
+            self.cell_states_flat[current] = EXPLORED_V
+            self.explored_count += 1
             
-            # Check if paths meet
-            if current in self.explored_backward:
+            # Check if paths meet (only when start == target: other meetings are caught on push)
+            if current == self.target_idx:
                 self.meeting_point = current
                 self.reconstruct_bidirectional_path()
                 self.finish_search(True)
                 return
             
             for neighbor in self.get_neighbors(current):
-                if neighbor not in self.explored_forward and neighbor not in self.frontier_forward:
-                    self.frontier_forward.append(neighbor)
+                state = self.cell_states_flat[neighbor]
+                if state != EXPLORED_V and state != FRONTIER_V:
+                    self.forward_queue.append(neighbor)
+                    self.frontier_count += 1
                     self.came_from_forward[neighbor] = current
-                    if neighbor != self.target:
-                        self.cell_states[neighbor[0]][neighbor[1]] = CellState.FRONTIER
-        
-        elif self.frontier_backward:
-            # Backward search
-            current = self.frontier_backward.popleft()
-            self.explored_backward.add(current)
-            if current != self.target:
-                self.cell_states[current[0]][current[1]] = CellState.EXPLORED2
+                    
+                    # Meet as soon as the backward search has reached this node
+                    if state != NONE_V:
+                        self.meeting_point = neighbor
+                        self.reconstruct_bidirectional_path()
+                        self.finish_search(True)
+                        return
+                    
+                    self.cell_states_flat[neighbor] = FRONTIER_V
+        
+        else:
+            # Backward search (non-empty: both frontiers empty was handled above)
+            current = self.backward_queue.popleft()
+            self.frontier_count -= 1
+            self.cell_states_flat[current] = EXPLORED2_V
+            self.explored_count += 1
             
             # Check if paths meet
-            if current in self.explored_forward:
+            if current == self.start_idx:
                 self.meeting_point = current
                 self.reconstruct_bidirectional_path()
                 self.finish_search(True)
                 return
             
             for neighbor in self.get_neighbors(current):
-                if neighbor not in self.explored_backward and neighbor not in self.frontier_backward:
-                    self.frontier_backward.append(neighbor)
+                state = self.cell_states_flat[neighbor]
+                if state != EXPLORED2_V and state != FRONTIER2_V:
+                    self.backward_queue.append(neighbor)
+                    self.frontier_count += 1
                     self.came_from_backward[neighbor] = current
-                    if neighbor != self.start:
-                        self.cell_states[neighbor[0]][neighbor[1]] = CellState.FRONTIER2
+                    
+                    # Meet as soon as the forward search has reached this node
+                    if state != NONE_V:
+                        self.meeting_point = neighbor
+                        self.reconstruct_bidirectional_path()
+                        self.finish_search(True)
+                        return
+                    
+                    self.cell_states_flat[neighbor] = FRONTIER2_V
         
         self.step_count += 1
     
     def reconstruct_path(self):
         """Reconstruct path from start to target"""
-        self.final_path = []
-        current = self.target
-        while current in self.came_from:
-            self.final_path.append(current)
+        path = []
+        current = self.target_idx
+        while current != self.start_idx:
+            path.append(current)
             current = self.came_from[current]
-        self.final_path.append(self.start)
-        self.final_path.reverse()
+        path.append(self.start_idx)
+        path.reverse()
+        self.final_path = [self.decode(node) for node in path]
         self.mark_path()
     
     def reconstruct_bidirectional_path(self):
         """Reconstruct path for bidirectional search"""
-        self.final_path = []
-        
-        # Forward path
+        # Forward path: start -> meeting point
         current = self.meeting_point
-        forward_path = []
-        while current in self.came_from_forward:
-            forward_path.append(current)
+        path = []
+        while current != self.start_idx:
+            path.append(current)
             current = self.came_from_forward[current]
-        forward_path.append(self.start)
-        forward_path.reverse()
+        path.append(self.start_idx)
+        path.reverse()
         
-        # Backward path
+        # Backward path: meeting point -> target
         current = self.meeting_point
-        backward_path = []
-        if current in self.came_from_backward and self.came_from_backward[current]:
+        while current != self.target_idx:
             current = self.came_from_backward[current]
-            while current in self.came_from_backward:
-                backward_path.append(current)
-                current = self.came_from_backward[current]
-            backward_path.append(self.target)
+            path.append(current)
         
-        self.final_path = forward_path + backward_path
+        self.final_path = [self.decode(node) for node in path]
         self.mark_path()
     
     def mark_path(self):
         """Mark the final path"""
-        for node in self.final_path:
-            if node != self.start and node != self.target:
-                self.cell_states[node[0]][node[1]] = CellState.PATH
+        # Endpoints are always start and target, which keep their own colors
+        cells = np.asarray(self.final_path[1:-1], dtype=np.intp).reshape(-1, 2)
+        self.cell_states[cells[:, 0], cells[:, 1]] = PATH_V
     
     def finish_search(self, found):
         """Complete the search"""
@@ -794,171 +1520,152 @@ class AllAlgorithmsPathfinder:
         if found:
             msg = f"✓ PATH FOUND! | {self.selected_algorithm} | "
             msg += f"Steps: {self.step_count} | "
+            msg += f"Explored: {self.explored_count} | Path: {len(self.final_path)}"
             
-            if self.selected_algorithm == 'Bidirectional':
-                explored = len(self.explored_forward) + len(self.explored_backward)
-            else:
-                explored = len(self.explored)
-            
-            msg += f"Explored: {explored} | Path: {len(self.final_path)}"
-            
-            if self.selected_algorithm == 'IDDFS':
+            if self.algo is Algo.IDDFS:
                 msg += f" | Depth: {self.current_depth_limit}"
             
             self.update_status(msg, Colors.SUCCESS)
         else:
             msg = f"❌ NO PATH | {self.selected_algorithm} | Steps: {self.step_count}"
-            if self.selected_algorithm == 'DLS':
+            if self.algo is Algo.DLS:
                 msg += f" | Depth limit: {self.depth_limit}"
-            elif self.selected_algorithm == 'IDDFS':
+            elif self.algo is Algo.IDDFS:
                 msg += f" | Max depth reached: {self.current_depth_limit}"
             self.update_status(msg, Colors.ERROR)
     
-    def get_cell_color(self, row, col):
+    def get_cell_color(self, cell_type, cell_state):
         """Get cell color based on type and state"""
-        cell_type = self.grid[row][col]
-        cell_state = self.cell_states[row][col]
-        
-        if cell_type == CellType.START:
+        if cell_type == START_V:
             return Colors.START
-        elif cell_type == CellType.TARGET:
+        elif cell_type == TARGET_V:
             return Colors.TARGET
-        elif cell_state == CellState.PATH:
+        elif cell_state == PATH_V:
             return Colors.PATH
-        elif cell_state == CellState.FRONTIER:
+        elif cell_state == FRONTIER_V:
             return Colors.FRONTIER
-        elif cell_state == CellState.FRONTIER2:
+        elif cell_state == FRONTIER2_V:
             return Colors.FRONTIER2
-        elif cell_state == CellState.EXPLORED:
+        elif cell_state == EXPLORED_V:
             return Colors.EXPLORED
-        elif cell_state == CellState.EXPLORED2:
+        elif cell_state == EXPLORED2_V:
             return Colors.EXPLORED2
-        elif cell_type == CellType.WALL:
+        elif cell_type == WALL_V:
             return Colors.WALL
         return Colors.EMPTY
     
-    def draw_button(self, button):
-        """Draw a button"""
-        mouse_pos = pygame.mouse.get_pos()
-        is_hovered = button['rect'].collidepoint(mouse_pos) and button['enabled']
-        color = Colors.BUTTON_HOVER if is_hovered else button['color']
-        
-        pygame.draw.rect(self.screen, color, button['rect'], border_radius=4)
-        pygame.draw.rect(self.screen, Colors.UI_BG, button['rect'], 2, border_radius=4)
+    def draw_button(self, surface, button, color):
+        """Draw a button onto surface in the given fill color"""
+        pygame.draw.rect(surface, color, button['rect'], border_radius=4)
+        pygame.draw.rect(surface, Colors.UI_BG, button['rect'], 2, border_radius=4)
         
         text_surface = self.button_font.render(button['text'], True, Colors.UI_TEXT)
         text_rect = text_surface.get_rect(center=button['rect'].center)
-        self.screen.blit(text_surface, text_rect)
+        surface.blit(text_surface, text_rect)
+    
+    def render_ui_panel(self, hovered):
+        """Redraw the cached UI panel: background, buttons (hovered one highlighted) and fixed labels"""
+        self.ui_surface.fill(Colors.UI_BG)
+        
+        for i, button in enumerate(self.all_buttons):
+            color = Colors.BUTTON_HOVER if i == hovered else button['color']
+            self.draw_button(self.ui_surface, button, color)
+        
+        self.ui_surface.blit(self.label_surfaces['algorithms'], (10, 0))
+        self.ui_surface.blit(self.label_surfaces['controls'], (10, 38))
+        self.ui_surface.blit(self.label_surfaces['presets'], (10, 76))
+        self.ui_surface.blit(self.label_surfaces['speed'], (self.window_width - 160, 0))
+        self.ui_surface.blit(self.label_surfaces['instructions'], (10, 165))
+        self.ui_surface.blit(self.algo_info_surfaces[self.selected_algorithm], (10, 185))
+        self.hovered_button = hovered
+        self.ui_stale = False
+    
+    def render_text(self, slot, font, text, color):
+        """Render a line of UI text, reusing the slot's last surface if text and color match"""
+        cached = self.text_surfaces.get(slot)
+        if cached is None or cached[0] != text or cached[1] != color:
+            cached = (text, color, font.render(text, True, color))
+            self.text_surfaces[slot] = cached
+        return cached[2]
     
     def draw(self):
-        """Draw everything"""
-        self.screen.fill(Colors.BG)
-        
-        # UI panel
-        ui_rect = pygame.Rect(0, 0, self.window_width, self.ui_height)
-        pygame.draw.rect(self.screen, Colors.UI_BG, ui_rect)
-        
-        # Draw buttons
-        for button in self.all_buttons:
-            self.draw_button(button)
-        
-        # Labels
-        label1 = self.info_font.render("Select Algorithm (or press 1-6):", True, Colors.UI_TEXT)
-        self.screen.blit(label1, (10, 0))
-        
-        label2 = self.info_font.render("Controls:", True, Colors.UI_TEXT)
-        self.screen.blit(label2, (10, 38))
-        
-        label3 = self.info_font.render("Presets:", True, Colors.UI_TEXT)
-        self.screen.blit(label3, (10, 76))
-        
-        speed_label = self.info_font.render("Speed:", True, Colors.UI_TEXT)
-        self.screen.blit(speed_label, (self.window_width - 160, 0))
-        
-        depth_label = self.info_font.render(f"DLS={self.depth_limit}:", True, Colors.UI_TEXT)
+        """Draw the UI panel and every grid cell that changed since the last frame"""
+        # UI panel from the cache
+        hovered = None
+        for i in pygame.Rect(self.mouse_pos, (1, 1)).collidelistall(self.button_rects):
+            if self.all_buttons[i]['enabled']:
+                hovered = i
+        if self.ui_stale or hovered != self.hovered_button:
+            self.render_ui_panel(hovered)
+        ui_rect = self.screen.blit(self.ui_surface, (0, 0))
+        
+        depth_label = self.render_text('depth', self.info_font, f"DLS={self.depth_limit}:", Colors.UI_TEXT)
         self.screen.blit(depth_label, (self.window_width - 160, 38))
         
+        steps_label = self.render_text('steps', self.info_font, f"Steps={self.steps_per_frame}:", Colors.UI_TEXT)
+        self.screen.blit(steps_label, (self.window_width - 160, 76))
+        
         # Status
-        status_surface = self.info_font.render(self.status_message, True, self.status_color)
+        status_surface = self.render_text('status', self.info_font, self.status_message, self.status_color)
         self.screen.blit(status_surface, (10, 125))
         
-        # Stats
-        if self.selected_algorithm == 'Bidirectional':
-            explored = len(self.explored_forward) + len(self.explored_backward)
-            frontier = len(self.frontier_forward) if self.frontier_forward else 0
-            frontier += len(self.frontier_backward) if self.frontier_backward else 0
-        else:
-            explored = len(self.explored)
-            frontier = len(self.frontier) if self.frontier else 0
-        
-        stats = f"Algorithm: {self.selected_algorithm} | Steps: {self.step_count} | "
-        stats += f"Frontier: {frontier} | Explored: {explored} | Path: {len(self.final_path)}"
+        # Stats (only formatted when a counter changed)
+        stats_key = (self.algo, self.step_count, self.frontier_count,
+                     self.explored_count, len(self.final_path), self.current_depth_limit)
+        if stats_key != self.stats_key:
+            stats = f"Algorithm: {self.selected_algorithm} | Steps: {self.step_count} | "
+            stats += f"Frontier: {self.frontier_count} | Explored: {self.explored_count} | "
+            stats += f"Path: {len(self.final_path)}"
+            
+            if self.algo is Algo.IDDFS:
+                stats += f" | Current Depth: {self.current_depth_limit}"
+            
+            self.render_text('stats', self.stats_font, stats, Colors.WARNING)
+            self.stats_key = stats_key
+        self.screen.blit(self.text_surfaces['stats'][2], (10, 145))
+        
+        algo_delay = self.render_text('delay', self.stats_font, f"Delay: {self.animation_delay}ms", Colors.UI_TEXT)
+        self.screen.blit(algo_delay, (10, 203))
+        
+        # Grid: blit only cells whose tile changed since the last frame, plus the S/T labels,
+        # in one batched call
+        tiles = self.tile_lut[(self.grid << 3) | self.cell_states]
+        nodes = np.flatnonzero(tiles != self.drawn_tiles).tolist()
+        labels = []
+        if self.start:
+            labels.append((self.start_label, self.encode(*self.start)))
+        if self.target:
+            labels.append((self.target_label, self.encode(*self.target)))
+        # Start/target are always repainted so their labels are not drawn over themselves
+        nodes.extend(node for _, node in labels)
         
-        if self.selected_algorithm == 'IDDFS':
-            stats += f" | Current Depth: {self.current_depth_limit}"
+        cell_tiles, cell_rects = self.cell_tiles, self.cell_rects
         
-        stats_surface = self.stats_font.render(stats, True, Colors.WARNING)
-        self.screen.blit(stats_surface, (10, 145))
+        blits = []
+        update_rects = [ui_rect]
+        for node, tile in zip(nodes, tiles.reshape(-1)[nodes].tolist()):
+            rect = cell_rects[node]
+            blits.append((cell_tiles[tile], rect))
+            update_rects.append(rect)
         
-        # Instructions
-        instructions = "S=Start | T=Target | SPACE=Run | C=Clear | R=Reset | Drag=Walls | ESC=Exit"
-        inst_surface = self.stats_font.render(instructions, True, Colors.UI_TEXT)
-        self.screen.blit(inst_surface, (10, 165))
+        for label, node in labels:
+            label_rect = label.get_rect(center=cell_rects[node].center)
+            blits.append((label, label_rect))
+            update_rects.append(label_rect)
         
-        # Algorithm info
-        algo_info = {
-            'BFS': "BFS: Queue (FIFO) - Guarantees shortest path",
-            'DFS': "DFS: Stack (LIFO) - Goes deep first",
-            'UCS': "UCS: Priority Queue - Considers edge costs",
-            'DLS': "DLS: Depth-Limited DFS - Stops at depth limit",
-            'IDDFS': "IDDFS: Iterative Deepening - Increases depth gradually",
-            'Bidirectional': "Bidirectional: Searches from both ends"
-        }
-        info_text = algo_info[self.selected_algorithm]
-        info_surface = self.stats_font.render(info_text, True, Colors.UI_TEXT)
-        self.screen.blit(info_surface, (10, 185))
-        
-        algo_delay = f"Delay: {self.animation_delay}ms"
-        delay_surface = self.stats_font.render(algo_delay, True, Colors.UI_TEXT)
-        self.screen.blit(delay_surface, (10, 203))
-        
-        # Grid
-        for row in range(self.rows):
-            for col in range(self.cols):
-                x = col * self.cell_size
-                y = row * self.cell_size + self.ui_height
-                color = self.get_cell_color(row, col)
-                cell_rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
-                pygame.draw.rect(self.screen, color, cell_rect)
-                pygame.draw.rect(self.screen, Colors.GRID_LINE, cell_rect, 1)
-        
-        # Labels
-        label_font = pygame.font.Font(None, int(self.cell_size * 1.3))
-        if self.start:
-            s_text = label_font.render('S', True, (255, 255, 255))
-            s_rect = s_text.get_rect(center=(
-                self.start[1] * self.cell_size + self.cell_size // 2,
-                self.start[0] * self.cell_size + self.cell_size // 2 + self.ui_height
-            ))
-            self.screen.blit(s_text, s_rect)
-        
-        if self.target:
-            t_text = label_font.render('T', True, (255, 255, 255))
-            t_rect = t_text.get_rect(center=(
-                self.target[1] * self.cell_size + self.cell_size // 2,
-                self.target[0] * self.cell_size + self.cell_size // 2 + self.ui_height
-            ))
-            self.screen.blit(t_text, t_rect)
+        self.screen.blits(blits, doreturn=False)
+        self.drawn_tiles = tiles
         
-        pygame.display.flip()
+        pygame.display.update(update_rects)
     
     def update(self):
         """Update game state"""
         if self.searching:
             current_time = pygame.time.get_ticks()
             if current_time - self.last_step_time >= self.animation_delay:
-                self.algorithm_step()
+                self.step_fn(self.steps_per_frame)
                 self.last_step_time = current_time
+                self.needs_redraw = True
     
     def run(self):
         """Main game loop"""
@@ -980,7 +1687,9 @@ class AllAlgorithmsPathfinder:
         while running:
             running = self.handle_events()
             self.update()
-            self.draw()
+            if self.needs_redraw:
+                self.draw()
+                self.needs_redraw = False
             self.clock.tick(self.fps)
         
         pygame.quit()